@@ -1,6 +1,50 @@
+import hashlib
+import hmac
+import itertools
+import os
+import queue
+import sys
+import threading
+import time
 import tkinter as tk
+from array import array
+from collections import deque
 from tkinter import messagebox, simpledialog
 
+# Maximum number of records read back from an account's on-disk log when the
+# history is requested; the log file itself keeps everything.
+MAX_TRANSACTIONS = 10_000
+
+# Maximum number of transaction lines kept in the history widget. The full
+# history stays in the account's on-disk log; only the display is trimmed.
+MAX_DISPLAY_LINES = 500
+
+# Minimum interval between dashboard redraws, in seconds (caps refresh at
+# roughly 20 Hz no matter how fast transactions arrive).
+REFRESH_INTERVAL = 0.05
+
+# Display templates for each transaction kind, pre-bound to str.format so
+# rendering a record is a single call with no per-call template lookup.
+# Records keep their compact (kind, amount, meta) shape and are only
+# formatted when actually shown.
+_FMT = {
+    "DEP": "Deposited Nu.{0}".format,
+    "WDR": "Withdrew Nu.{0}".format,
+    "TOP": "Mobile top-up Nu.{0} to {1}".format,
+    "OUT": "Sent Nu.{0} to {1} (Acc: {2})".format,
+    "IN": "Received Nu.{0} from {1} (Acc: {2})".format,
+}
+
+
+def _format_txn(entry):
+    """Render a (kind, amount, meta) transaction record as a display string."""
+    kind, amount, meta = entry
+    fmt = _FMT[kind]
+    if meta is None:
+        return fmt(amount)
+    return fmt(amount, *meta)
+
+
 class InvalidAmountError(Exception):
     """
     Raised when a transaction amount is invalid (zero or negative).
@@ -23,62 +67,219 @@ class BankAccount:
     Attributes:
         acc_no (str): Unique account number.
         name (str): Account holder's name.
-        password (str): User-defined password for login.
         acc_type (str): 'Personal' or 'Business' account type.
         balance (float): Current account balance.
-        transactions (list): Log of all transactions performed.
+        txn_count (int): Number of transactions recorded this session.
+
+    Transactions are persisted to an append-only log file (bank_<acc_no>.log)
+    instead of being held in memory: RAM per account stays constant however
+    long the history grows, and the log survives a crash. A short in-memory
+    tail of the newest MAX_DISPLAY_LINES records lets the dashboard refresh
+    incrementally without re-reading the file.
+
+    The login password is never stored: only a salted blake2b digest is
+    kept, and check_password compares digests in constant time.
+
+    Accounts are fixed-shape objects, so __slots__ replaces the per-instance
+    __dict__: less memory per account and faster attribute access.
     """
 
-    def __init__(self, acc_no, name, password, acc_type, balance=0):
+    __slots__ = ('acc_no', 'name', '_salt', '_pwhash', 'acc_type', 'balance',
+                 '_log_fh', '_log_prefix', '_recent', 'txn_count', 'on_change')
+
+    # Fully typed so the class is ready for AOT compilation (mypyc/Cython):
+    # every field has a stable type.
+    acc_no: str
+    name: str
+    _salt: bytes
+    _pwhash: bytes
+    acc_type: str
+    balance: float
+
+    def __init__(self, acc_no: str, name: str, password: str, acc_type: str,
+                 balance: float = 0) -> None:
         """Initialize account details upon creation."""
         self.acc_no = acc_no
         self.name = name
-        self.password = password
-        self.acc_type = acc_type
+        # Hash the password once at signup; the plaintext is not retained.
+        self._salt = os.urandom(16)
+        self._pwhash = hashlib.blake2b(password.encode(), salt=self._salt,
+                                       digest_size=32).digest()
+        # acc_type is always one of a couple of values; interning makes every
+        # account share the same string object.
+        self.acc_type = sys.intern(acc_type)
         self.balance = balance
-        self.transactions = []
+        # Fresh log at signup: accounts do not outlive the process, so a
+        # leftover file from an earlier run must not leak its history into a
+        # new account with the same number. Records are only ever appended
+        # after this, line-buffered so each one hits the disk promptly.
+        self._log_fh = open(f"bank_{acc_no}.log", "w", buffering=1)
+        self._log_prefix = f"BANK #{acc_no}:"  # shared by every record line
+        self._recent = deque(maxlen=MAX_DISPLAY_LINES)  # newest records, for display
+        self.txn_count = 0
+        self.on_change = None  # optional callback fired after balance changes
+
+    def close(self) -> None:
+        """Close the on-disk transaction log."""
+        self._log_fh.close()
+
+    def check_password(self, password: str) -> bool:
+        """Check a login attempt against the stored digest in constant time."""
+        attempt = hashlib.blake2b(password.encode(), salt=self._salt,
+                                  digest_size=32).digest()
+        return hmac.compare_digest(self._pwhash, attempt)
+
+    def _record(self, kind: str, amount, meta=None) -> None:
+        """Append one structured record to the on-disk transaction log."""
+        fields = [kind, str(amount)]
+        if meta is not None:
+            fields.extend(str(part) for part in meta)
+        self._log_fh.write(self._log_prefix + "\t".join(fields) + "\n")
+        self._recent.append((kind, amount, meta))
+        self.txn_count += 1
+
+    def _notify(self) -> None:
+        """Report a balance change to the owner's callback, if one is set."""
+        if self.on_change is not None:
+            self.on_change(self)
+
+    def _check_debit(self, amount: float) -> None:
+        """Validate an amount that is about to be debited from this account."""
+        if amount <= 0:
+            raise InvalidAmountError("Amount must be positive")
+        if amount > self.balance:
+            raise InsufficientFundsError("Not enough balance")
 
-    def deposit(self, amount):
+    def deposit(self, amount: float) -> None:
         """Add funds to account, recording transaction."""
         if amount <= 0:
             raise InvalidAmountError("Amount must be positive")
         self.balance += amount
-        self.transactions.append(f"Deposited Nu.{amount}")
+        self._record("DEP", amount)
+        self._notify()
 
-    def withdraw(self, amount):
+    def withdraw(self, amount: float) -> None:
         """Withdraw funds if sufficient, recording transaction."""
-        if amount <= 0:
-            raise InvalidAmountError("Amount must be positive")
-        if amount > self.balance:
-            raise InsufficientFundsError("Not enough balance")
+        self._check_debit(amount)
         self.balance -= amount
-        self.transactions.append(f"Withdrew Nu.{amount}")
+        self._record("WDR", amount)
+        self._notify()
 
-    def transfer(self, amount, target):
+    def transfer(self, amount: float, target: 'BankAccount') -> None:
         """Transfer funds to another BankAccount."""
-        if amount <= 0:
-            raise InvalidAmountError("Amount must be positive")
-        if amount > self.balance:
-            raise InsufficientFundsError("Not enough balance")
+        self._check_debit(amount)
         if target == self:
             raise InvalidAmountError("Cannot transfer to same account")
+        # Bracket the two-sided update with START/COMMIT markers so a replay
+        # after a crash can treat an uncommitted transfer as void.
+        self._log_fh.write(self._log_prefix + "\t".join(("XFER-START", str(amount), target.acc_no)) + "\n")
         self.balance -= amount
         target.balance += amount
-        self.transactions.append(f"Sent Nu.{amount} to {target.name} (Acc: {target.acc_no})")
-        target.transactions.append(f"Received Nu.{amount} from {self.name} (Acc: {self.acc_no})")
+        self._record("OUT", amount, (target.name, target.acc_no))
+        target._record("IN", amount, (self.name, self.acc_no))
+        self._log_fh.write(self._log_prefix + "\t".join(("XFER-COMMIT", str(amount), target.acc_no)) + "\n")
+        self._notify()
+        target._notify()
 
-    def mobile_topup(self, amount, number):
+    def mobile_topup(self, amount: float, number: str) -> None:
         """Deduct funds for a mobile recharge and log transaction."""
-        if amount <= 0:
-            raise InvalidAmountError("Amount must be positive")
-        if amount > self.balance:
-            raise InsufficientFundsError("Not enough balance")
+        self._check_debit(amount)
         self.balance -= amount
-        self.transactions.append(f"Mobile top-up Nu.{amount} to {number}")
+        self._record("TOP", amount, (number,))
+        self._notify()
 
-    def get_transactions(self):
-        """Retrieve the transaction history list."""
-        return self.transactions
+    def recent_transactions(self, count: int | None = None) -> list:
+        """
+        Render the newest `count` transactions (at most the retained
+        MAX_DISPLAY_LINES) from the in-memory tail; the log is not read.
+        """
+        if count is None or count > len(self._recent):
+            count = len(self._recent)
+        start = len(self._recent) - count
+        return [_format_txn(entry) for entry in
+                itertools.islice(self._recent, start, None)]
+
+    def get_transactions(self) -> list:
+        """
+        Read back the last MAX_TRANSACTIONS log records as display strings
+        (most recent last). Transfer START/COMMIT markers are skipped.
+        """
+        self._log_fh.flush()
+        with open(self._log_fh.name, encoding=self._log_fh.encoding) as f:
+            tail = deque(f, maxlen=MAX_TRANSACTIONS)
+        history = []
+        for line in tail:
+            head, _, payload = line.rstrip("\n").partition("\t")
+            kind = head.rpartition(":")[2]
+            if kind not in _FMT:
+                continue
+            fields = payload.split("\t")
+            history.append(_format_txn((kind, fields[0], tuple(fields[1:]) or None)))
+        return history
+
+
+class _CachedStringDialog(tk.Toplevel):
+    """
+    A reusable text-prompt window built once and shown/hidden per ask.
+
+    simpledialog.askstring constructs a fresh Toplevel and spins a nested
+    mainloop for every prompt; this dialog keeps its widgets alive, retexts
+    them, and waits on a variable instead, so repeated prompts only pay the
+    cost of mapping the window.
+    """
+
+    def __init__(self, master):
+        """Build the prompt widgets once, hidden until the first ask."""
+        super().__init__(master)
+        self.withdraw()
+        self.resizable(False, False)
+        self.protocol("WM_DELETE_WINDOW", self._cancel)
+
+        self._label = tk.Label(self)
+        self._label.pack(padx=10, pady=(10, 5))
+        self._entry = tk.Entry(self, width=30)
+        self._entry.pack(padx=10, pady=5)
+        self._entry.bind("<Return>", lambda event: self._ok())
+        self._entry.bind("<Escape>", lambda event: self._cancel())
+
+        buttons = tk.Frame(self)
+        buttons.pack(pady=(5, 10))
+        tk.Button(buttons, text="OK", width=8, command=self._ok).pack(side=tk.LEFT, padx=5)
+        tk.Button(buttons, text="Cancel", width=8, command=self._cancel).pack(side=tk.LEFT, padx=5)
+
+        self._done = tk.IntVar(self)
+        self._result = None
+
+    def _ok(self):
+        self._result = self._entry.get()
+        self._done.set(1)
+
+    def _cancel(self):
+        self._result = None
+        self._done.set(1)
+
+    def ask(self, title, prompt, show=''):
+        """Show the dialog modally and return the entered string, or None."""
+        self.title(title)
+        self._label.config(text=prompt)
+        self._entry.config(show=show)
+        self._entry.delete(0, tk.END)
+        self._result = None
+        self.transient(self.master)
+        self.deiconify()
+        self._entry.focus_set()
+        # The window must be mapped before grab_set, or X11 raises
+        # "grab failed: window not viewable"; tolerate a failed grab the
+        # same way simpledialog does.
+        self.wait_visibility()
+        try:
+            self.grab_set()
+        except tk.TclError:
+            pass
+        self.wait_variable(self._done)
+        self.grab_release()
+        self.withdraw()
+        return self._result
 
 
 # -----------------------------
@@ -98,50 +299,93 @@ class BankingApp:
         self.master = master
         master.title("mBoB Bhutanese Banking App")
         self.accounts = {}   # Dictionary to store acc_no: BankAccount pairs
+        # Structure-of-arrays mirror of every balance: one contiguous block of
+        # doubles, so bulk queries scan memory instead of chasing objects.
+        self._acc_index = {}        # acc_no -> slot in _balances
+        self._balances = array('d')
         self.current = None  # Tracks currently logged-in account
+        self._dirty = False  # True when the dashboard needs a refresh
+        self._last_flush = 0.0  # monotonic time of the last actual redraw
+        # Transactions run on a worker thread so the Tk loop never blocks on
+        # an expensive mutation; the GUI polls result_queue for outcomes.
+        self.txn_queue = queue.Queue()     # (account, method name, args, success message)
+        self.result_queue = queue.Queue()  # (succeeded, message to show)
+        self._accounts_lock = threading.Lock()
+        threading.Thread(target=self._txn_worker, daemon=True).start()
+        master.after(50, self._drain_results)
+        # Flush any refresh that was deferred while the window was hidden.
+        master.bind("<Map>", lambda event: self._flush_refresh())
+
+        # The menu and dashboard each live in a persistent frame; switching
+        # screens swaps frames instead of destroying and recreating widgets.
+        self.menu_frame = tk.Frame(master)
+        tk.Label(self.menu_frame, text="Welcome to Bhutanese mBoB Banking App", font=("Arial", 14)).pack(pady=10)
+        tk.Button(self.menu_frame, text="Login", width=20, command=self.login).pack(pady=5)
+        tk.Button(self.menu_frame, text="Sign Up", width=20, command=self.sign_up).pack(pady=5)
+        tk.Button(self.menu_frame, text="Quit", width=20, command=self.master.quit).pack(pady=5)
+        self.dashboard_frame = None  # built lazily on first login
+        self._str_prompt = None      # reusable text-prompt dialog, built on demand
+
         self.main_menu()     # Load the home screen menu
 
-    def main_menu(self):
-        """Display the welcome screen with login, signup, and quit options."""
-        for widget in self.master.winfo_children():
-            widget.destroy()
+    def _ask_string(self, title, prompt, show=''):
+        """Prompt for a line of text via the cached dialog (None if cancelled)."""
+        if self._str_prompt is None:
+            self._str_prompt = _CachedStringDialog(self.master)
+        return self._str_prompt.ask(title, prompt, show=show)
 
-        # Title and navigation buttons
-        tk.Label(self.master, text="Welcome to Bhutanese mBoB Banking App", font=("Arial", 14)).pack(pady=10)
-        tk.Button(self.master, text="Login", width=20, command=self.login).pack(pady=5)
-        tk.Button(self.master, text="Sign Up", width=20, command=self.sign_up).pack(pady=5)
-        tk.Button(self.master, text="Quit", width=20, command=self.master.quit).pack(pady=5)
+    def main_menu(self):
+        """Show the welcome screen by swapping frames in; nothing is rebuilt."""
+        if self.dashboard_frame is not None:
+            self.dashboard_frame.pack_forget()
+        self.menu_frame.pack(padx=10, pady=10)
 
     def sign_up(self):
         """
         Prompt the user to create a new account.
         Requires an account number, name, account type, password, and opening balance.
         """
-        acc_no = simpledialog.askstring("Sign Up", "Enter new account number:")
+        acc_no = self._ask_string("Sign Up", "Enter new account number:")
         if not acc_no:
             return
         if acc_no in self.accounts:
             messagebox.showerror("Error", "Account number already exists")
             return
 
-        name = simpledialog.askstring("Sign Up", "Enter your name:")
+        name = self._ask_string("Sign Up", "Enter your name:")
         if not name:
             return
 
-        acc_type = simpledialog.askstring("Sign Up", "Account Type (Personal/Business):")
+        acc_type = self._ask_string("Sign Up", "Account Type (Personal/Business):")
         if not acc_type or acc_type.lower() not in ['personal', 'business']:
             messagebox.showerror("Error", "Invalid account type. Please enter Personal or Business.")
             return
 
-        password = simpledialog.askstring("Sign Up", "Set your password:", show='*')
+        password = self._ask_string("Sign Up", "Set your password:", show='*')
         if not password:
             return
 
         bal = simpledialog.askfloat("Sign Up", "Opening balance (Nu.):", minvalue=0)
         if bal is not None:
-            self.accounts[acc_no] = BankAccount(acc_no, name, password, acc_type.capitalize(), bal)
+            acc = BankAccount(acc_no, name, password, acc_type.capitalize(), bal)
+            self.accounts[acc_no] = acc
+            self._register_account(acc)
             messagebox.showinfo("Success", f"{acc_type.capitalize()} account created for {name}\nAcc No: {acc_no}")
 
+    def _register_account(self, acc):
+        """Give the account a slot in the balance array and keep it in sync."""
+        self._acc_index[acc.acc_no] = len(self._balances)
+        self._balances.append(acc.balance)
+        acc.on_change = self._record_balance
+
+    def _record_balance(self, acc):
+        """Mirror an account's new balance into its balance-array slot."""
+        self._balances[self._acc_index[acc.acc_no]] = acc.balance
+
+    def total_assets(self):
+        """Sum all account balances with one pass over the balance array."""
+        return sum(self._balances)
+
     def login(self):
         """
         Prompt user for login credentials and validate them.
@@ -151,73 +395,155 @@ class BankingApp:
             messagebox.showerror("Error", "No accounts available")
             return
 
-        acc_no = simpledialog.askstring("Login", "Enter your account number:")
-        if not acc_no or acc_no not in self.accounts:
+        acc_no = self._ask_string("Login", "Enter your account number:")
+        acc = self.accounts.get(acc_no) if acc_no else None
+        if acc is None:
             messagebox.showerror("Error", "Account not found")
             return
 
-        password = simpledialog.askstring("Login", "Enter your password:", show='*')
-        if password != self.accounts[acc_no].password:
+        password = self._ask_string("Login", "Enter your password:", show='*')
+        if password is None or not acc.check_password(password):
             messagebox.showerror("Error", "Incorrect password")
             return
 
-        self.current = self.accounts[acc_no]
+        self.current = acc
         messagebox.showinfo("Success", f"Welcome {self.current.name}!")
         self.account_dashboard()
 
     def account_dashboard(self):
         """Display the main banking dashboard with available account operations."""
-        for widget in self.master.winfo_children():
-            widget.destroy()
+        self.menu_frame.pack_forget()
+        if self.dashboard_frame is None:
+            self._build_dashboard()
+
+        # Rebind the persistent widgets to the account that just logged in.
+        self.header_label.config(text=f"{self.current.name}'s {self.current.acc_type} Account")
+        self.acc_no_label.config(text=f"Account Number: {self.current.acc_no}")
+        self.balance_label.config(text=f"Balance: Nu.{self.current.balance:.2f}")
+        self._last_balance = self.current.balance  # last balance drawn on the label
+        self.txn_list.delete(0, tk.END)
+        self._rendered_count = 0  # account txn_count already drawn in txn_list
+
+        self.dashboard_frame.pack(padx=10, pady=10)
+        self.update_display()
+
+    def _build_dashboard(self):
+        """Create the dashboard widgets once; later logins only retext them."""
+        frame = self.dashboard_frame = tk.Frame(self.master)
 
         # Account info display
-        tk.Label(self.master, text=f"{self.current.name}'s {self.current.acc_type} Account", font=("Arial", 14)).pack(pady=5)
-        tk.Label(self.master, text=f"Account Number: {self.current.acc_no}", font=("Arial", 12)).pack(pady=2)
+        self.header_label = tk.Label(frame, font=("Arial", 14))
+        self.header_label.pack(pady=5)
+        self.acc_no_label = tk.Label(frame, font=("Arial", 12))
+        self.acc_no_label.pack(pady=2)
 
-        self.balance_label = tk.Label(self.master, text=f"Balance: Nu.{self.current.balance:.2f}")
+        self.balance_label = tk.Label(frame)
         self.balance_label.pack()
 
-        self.txn_text = tk.Text(self.master, height=8, width=45, state=tk.DISABLED)
-        self.txn_text.pack(pady=5)
-        self.update_display()
+        # A Listbox virtualizes its rows internally, so only the visible
+        # window is ever painted regardless of how many entries it holds.
+        self.txn_list = tk.Listbox(frame, height=8, width=45)
+        self.txn_list.pack(pady=5)
 
         # Action buttons
-        tk.Button(self.master, text="Deposit", width=25, command=self.deposit).pack(pady=2)
-        tk.Button(self.master, text="Withdraw", width=25, command=self.withdraw).pack(pady=2)
-        tk.Button(self.master, text="Fund Transfer", width=25, command=self.transfer).pack(pady=2)
-        tk.Button(self.master, text="Mobile Top-Up", width=25, command=self.mobile_topup).pack(pady=2)
-        tk.Button(self.master, text="Logout", width=25, command=self.logout).pack(pady=10)
+        tk.Button(frame, text="Deposit", width=25, command=self.deposit).pack(pady=2)
+        tk.Button(frame, text="Withdraw", width=25, command=self.withdraw).pack(pady=2)
+        tk.Button(frame, text="Fund Transfer", width=25, command=self.transfer).pack(pady=2)
+        tk.Button(frame, text="Mobile Top-Up", width=25, command=self.mobile_topup).pack(pady=2)
+        tk.Button(frame, text="Logout", width=25, command=self.logout).pack(pady=10)
+
+    def _txn_worker(self):
+        """
+        Worker-thread loop: apply queued account mutations and report each
+        outcome on result_queue. A single lock serializes mutations so
+        transfers touching two accounts stay consistent. No Tk calls happen
+        here; the GUI picks results up in _drain_results on the main thread.
+        """
+        while True:
+            account, method, args, success_msg = self.txn_queue.get()
+            try:
+                with self._accounts_lock:
+                    getattr(account, method)(*args)
+            except Exception as e:
+                self.result_queue.put((False, str(e)))
+            else:
+                self.result_queue.put((True, success_msg))
+            self.txn_queue.task_done()
+
+    def _drain_results(self):
+        """Poll worker results on the Tk thread and surface them in the GUI."""
+        try:
+            while True:
+                ok, msg = self.result_queue.get_nowait()
+                self._request_refresh()
+                if ok:
+                    messagebox.showinfo("Success", msg)
+                else:
+                    messagebox.showerror("Error", msg)
+        except queue.Empty:
+            pass
+        self.master.after(50, self._drain_results)
+
+    def _request_refresh(self):
+        """
+        Mark the dashboard as needing a refresh and schedule one. Bursts of
+        transactions coalesce into a single redraw, nothing is drawn while
+        the window is not visible, and redraws happen at most once per
+        REFRESH_INTERVAL so rapid scripted activity cannot flood Tk.
+        """
+        self._dirty = True
+        if time.monotonic() - self._last_flush >= REFRESH_INTERVAL:
+            self.master.after_idle(self._flush_refresh)
+        else:
+            self.master.after(int(REFRESH_INTERVAL * 1000), self._flush_refresh)
+
+    def _flush_refresh(self):
+        """Run a pending refresh, if any, once the window is viewable."""
+        if self._dirty and self.current is not None and self.master.winfo_viewable():
+            self._dirty = False
+            self._last_flush = time.monotonic()
+            self.update_display()
 
     def update_display(self):
-        """Refresh the transaction history and account balance display."""
-        self.balance_label.config(text=f"Balance: Nu.{self.current.balance:.2f}")
-        self.txn_text.config(state=tk.NORMAL)
-        self.txn_text.delete(1.0, tk.END)
-        for t in self.current.transactions:
-            self.txn_text.insert(tk.END, f"{t}\n")
-        self.txn_text.config(state=tk.DISABLED)
+        """
+        Refresh the account balance and append any new transactions.
+
+        Only transactions recorded since the last refresh are inserted, so the
+        cost of an update stays constant instead of growing with history length.
+        The widget keeps at most MAX_DISPLAY_LINES lines, dropping the oldest
+        ones first; the full history remains in the account's on-disk log.
+        """
+        balance = self.current.balance
+        if balance != self._last_balance:
+            self.balance_label.config(text=f"Balance: Nu.{balance:.2f}")
+            self._last_balance = balance
+        # Compare against the monotonic txn_count, not a tail length: it
+        # keeps counting however large the history grows. The new entries
+        # come from the account's in-memory tail, so a refresh costs only
+        # the records added since the last one -- no log-file read.
+        pending = self.current.txn_count - self._rendered_count
+        if pending > 0:
+            new = self.current.recent_transactions(pending)
+            at_bottom = self.txn_list.yview()[1] == 1.0
+            self.txn_list.insert(tk.END, *new)
+            excess = self.txn_list.size() - MAX_DISPLAY_LINES
+            if excess > 0:
+                self.txn_list.delete(0, excess - 1)
+            if at_bottom:
+                self.txn_list.see(tk.END)
+            self._rendered_count = self.current.txn_count
 
     def deposit(self):
         """Prompt user to deposit money into their account."""
         amt = simpledialog.askfloat("Deposit", "Amount (Nu.):", minvalue=0.01)
         if amt:
-            try:
-                self.current.deposit(amt)
-                self.update_display()
-                messagebox.showinfo("Success", f"Deposited Nu.{amt}")
-            except Exception as e:
-                messagebox.showerror("Error", str(e))
+            self.txn_queue.put((self.current, "deposit", (amt,), f"Deposited Nu.{amt}"))
 
     def withdraw(self):
         """Prompt user to withdraw money from their account."""
         amt = simpledialog.askfloat("Withdraw", "Amount (Nu.):", minvalue=0.01)
         if amt:
-            try:
-                self.current.withdraw(amt)
-                self.update_display()
-                messagebox.showinfo("Success", f"Withdrew Nu.{amt}")
-            except Exception as e:
-                messagebox.showerror("Error", str(e))
+            self.txn_queue.put((self.current, "withdraw", (amt,), f"Withdrew Nu.{amt}"))
 
     def transfer(self):
         """Prompt user to transfer funds to another registered account."""
@@ -225,36 +551,30 @@ class BankingApp:
             messagebox.showerror("Error", "Need at least 2 accounts")
             return
 
-        target_acc = simpledialog.askstring("Fund Transfer", "Recipient's account number:")
-        if not target_acc or target_acc not in self.accounts or target_acc == self.current.acc_no:
+        target_acc = self._ask_string("Fund Transfer", "Recipient's account number:")
+        target = self.accounts.get(target_acc) if target_acc else None
+        if target is None or target is self.current:
             messagebox.showerror("Error", "Invalid recipient")
             return
 
         amt = simpledialog.askfloat("Fund Transfer", "Amount (Nu.):", minvalue=0.01)
         if amt:
-            try:
-                self.current.transfer(amt, self.accounts[target_acc])
-                self.update_display()
-                messagebox.showinfo("Success", f"Transferred Nu.{amt} to {target_acc}")
-            except Exception as e:
-                messagebox.showerror("Error", str(e))
+            self.txn_queue.put((self.current, "transfer", (amt, target),
+                                f"Transferred Nu.{amt} to {target_acc}"))
 
     def mobile_topup(self):
         """Prompt user for mobile number and top-up amount."""
-        number = simpledialog.askstring("Mobile Top-Up", "Mobile number:")
+        number = self._ask_string("Mobile Top-Up", "Mobile number:")
         if number:
             amt = simpledialog.askfloat("Top-Up", "Amount (Nu.):", minvalue=0.01)
             if amt:
-                try:
-                    self.current.mobile_topup(amt, number)
-                    self.update_display()
-                    messagebox.showinfo("Success", f"Topped up Nu.{amt} to {number}")
-                except Exception as e:
-                    messagebox.showerror("Error", str(e))
+                self.txn_queue.put((self.current, "mobile_topup", (amt, number),
+                                    f"Topped up Nu.{amt} to {number}"))
 
     def logout(self):
         """Log out the current account and return to the main menu."""
         self.current = None
+        self._rendered_count = 0
         self.main_menu()
 
 
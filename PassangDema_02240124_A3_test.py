@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from PassangDema_02240124_A3_PA import BankAccount, InvalidAmountError, InsufficientFundsError
 
@@ -8,31 +10,32 @@ from PassangDema_02240124_A3_PA import BankAccount, InvalidAmountError, Insuffic
 class TestBankAccount(unittest.TestCase):
 
     def setUp(self):
-        """Set up test accounts for each test"""
+        """Set up test accounts for each test, writing logs to a throwaway dir"""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        old_cwd = os.getcwd()
+        os.chdir(tmpdir.name)
+        self.addCleanup(os.chdir, old_cwd)
         self.acc1 = BankAccount("001", "Alice", "pass123", "Personal", 1000)
+        self.addCleanup(self.acc1.close)
         self.acc2 = BankAccount("002", "Bob", "pass456", "Business", 500)
+        self.addCleanup(self.acc2.close)
 
     # 1️⃣ Unusual user input
 
-    def test_deposit_negative_amount(self):
-        with self.assertRaises(InvalidAmountError):
-            self.acc1.deposit(-100)
-
-    def test_withdraw_negative_amount(self):
-        with self.assertRaises(InvalidAmountError):
-            self.acc1.withdraw(-50)
-
-    def test_transfer_negative_amount(self):
-        with self.assertRaises(InvalidAmountError):
-            self.acc1.transfer(-200, self.acc2)
-
-    def test_mobile_topup_negative_amount(self):
-        with self.assertRaises(InvalidAmountError):
-            self.acc1.mobile_topup(-20, "17123456")
-
-    def test_transfer_to_self(self):
-        with self.assertRaises(InvalidAmountError):
-            self.acc1.transfer(100, self.acc1)
+    def test_invalid_amounts(self):
+        """Every operation rejects bad input, checked as subTests on one fixture."""
+        cases = [
+            ("deposit negative", lambda: self.acc1.deposit(-100)),
+            ("withdraw negative", lambda: self.acc1.withdraw(-50)),
+            ("transfer negative", lambda: self.acc1.transfer(-200, self.acc2)),
+            ("topup negative", lambda: self.acc1.mobile_topup(-20, "17123456")),
+            ("transfer to self", lambda: self.acc1.transfer(100, self.acc1)),
+        ]
+        for name, op in cases:
+            with self.subTest(op=name):
+                with self.assertRaises(InvalidAmountError):
+                    op()
 
     # 2️⃣ Invalid usage of application functions
 